@@ -29,12 +29,17 @@ GROUND_Y = HEIGHT - 120  # ground height
 PLAYER_X = 140
 GRAVITY = 1.2
 JUMP_VELOCITY = -13
+# fixed-point (1/256 px) versions used by the physics step
+FIXED_SHIFT = 8
+GRAVITY_Q = int(GRAVITY * 256)
+JUMP_Q = int(JUMP_VELOCITY * 256)
 INITIAL_SPEED = 6.0
 SPEED_INCREASE_RATE = 0.0009  # per frame, small increase for long runs
 MAX_SPEED = 13.0  # Cap the speed to keep game fair
-STONE_SPAWN_BASE = 1400  # ms base interval
 STONE_GAP_VARIANCE = 700  # variance for spawn timing
 FONT_NAME = None  # default font
+PHYSICS_STEP = 1000 / FPS  # ms per fixed physics step (physics is tuned per 60 FPS frame)
+MAX_PHYSICS_STEPS = 5  # cap catch-up steps after a long stall
 
 ASSET_FILENAMES = {
     "player": "ong.png",
@@ -52,6 +57,8 @@ HIGHSCORE_FILE = "highscore.txt"
 
 # --- Init Pygame ---
 pygame.init()
+# never handled, so keep them out of the queue entirely
+pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE])
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Ong Jump")
 clock = pygame.time.Clock()
@@ -59,6 +66,7 @@ clock = pygame.time.Clock()
 # load font
 font = pygame.font.Font(FONT_NAME, 28)
 big_font = pygame.font.Font(FONT_NAME, 48)
+INSTR_SURF = font.render("Press SPACE to jump", True, (200,200,200))
 
 # utility for loading images with fallback
 def load_image(name, fallback_size=None):
@@ -74,7 +82,7 @@ def load_image(name, fallback_size=None):
     surf = pygame.Surface((w, h), pygame.SRCALPHA)
     surf.fill((200, 200, 200, 255))
     pygame.draw.rect(surf, (120, 120, 120), surf.get_rect(), 4)
-    return surf
+    return surf.convert_alpha()
 
 # load sounds with safe fallback
 def load_sound(name):
@@ -95,6 +103,11 @@ bg_day_img = load_image(ASSET_FILENAMES["bg_day"], fallback_size=(WIDTH, HEIGHT)
 bg_night_img = load_image(ASSET_FILENAMES["bg_night"], fallback_size=(WIDTH, HEIGHT))
 splash_img = load_image(ASSET_FILENAMES["splash"], fallback_size=(WIDTH, HEIGHT))
 
+# pre-scaled sprites, shared by every instance instead of rescaling per spawn/frame
+SPLASH_SCALED = pygame.transform.scale(splash_img, (WIDTH, HEIGHT)).convert()
+PLAYER_SCALED = pygame.transform.scale(player_img, (80, 80)).convert_alpha()
+STONE_SCALED = pygame.transform.scale(stone_img, (60, 32)).convert_alpha()
+
 jump_sfx = load_sound(ASSET_FILENAMES["jump_sfx"])
 hit_sfx = load_sound(ASSET_FILENAMES["hit_sfx"])
 score_sfx = load_sound(ASSET_FILENAMES["score_sfx"])
@@ -126,56 +139,76 @@ def load_highscore():
 class Player(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
-        self.image_orig = pygame.transform.smoothscale(player_img, (80, 80))
+        self.image_orig = PLAYER_SCALED
         self.image = self.image_orig.copy()
         self.rect = self.image.get_rect(midbottom=(PLAYER_X, GROUND_Y))
-        self.vel_y = 0.0
+        self.hitbox = self.rect.inflate(-10, -6)
+        self.prev_y = self.rect.y  # position before the last physics step, for interpolation
+        self.vel_y_q = 0  # 1/256 px per frame
         self.on_ground = True
         self.jump_cooldown = 0
 
     def update(self):
         # apply gravity
-        self.vel_y += GRAVITY
-        self.rect.y += int(self.vel_y)
+        self.prev_y = self.rect.y
+        self.vel_y_q += GRAVITY_Q
+        # round toward zero like int() so the jump arc is unchanged
+        v = self.vel_y_q
+        self.rect.y += v >> FIXED_SHIFT if v >= 0 else -((-v) >> FIXED_SHIFT)
         # ground collision
         if self.rect.bottom >= GROUND_Y:
             self.rect.bottom = GROUND_Y
-            self.vel_y = 0
+            self.vel_y_q = 0
             self.on_ground = True
         else:
             self.on_ground = False
+        self.hitbox.midbottom = self.rect.midbottom
         if self.jump_cooldown > 0:
             self.jump_cooldown -= 1
 
     def jump(self):
         if self.on_ground and self.jump_cooldown == 0:
-            self.vel_y = JUMP_VELOCITY
+            self.vel_y_q = JUMP_Q
             self.on_ground = False
             self.jump_cooldown = 8
             if jump_sfx:
                 jump_sfx.play()
 
-    def draw(self, surf):
-        surf.blit(self.image, self.rect)
+    def draw(self, surf, alpha=1.0):
+        # alpha: fraction of the next physics step already elapsed
+        y = self.prev_y + (self.rect.y - self.prev_y) * alpha
+        surf.blit(self.image, (self.rect.x, y))
 
 class Stone(pygame.sprite.Sprite):
     def __init__(self, x, speed):
         super().__init__()
-        # Make stone smaller (e.g., 60x32)
-        self.image = pygame.transform.smoothscale(stone_img, (60, 32))
-        self.rect = self.image.get_rect(bottomleft=(x, GROUND_Y))
-        self.speed = speed
-
-    def update(self, speed_multiplier, dt):
-        # Move left using frame time for smooth, frame-independent movement
-        move_x = self.speed * speed_multiplier * (dt / 16.67)  # 16.67ms = 60 FPS baseline
-        self.rect.x -= int(move_x)
-        # Remove if off screen
-        if self.rect.right < -50:
-            self.kill()
-
-    def draw(self, surf):
-        surf.blit(self.image, self.rect)
+        # Make stone smaller (e.g., 60x32), shared surface
+        self.image = STONE_SCALED
+        self.rect = STONE_SCALED.get_rect(bottomleft=(x, GROUND_Y))
+        # slightly inset hitbox for visual margin
+        self.hitbox = self.rect.inflate(-10, -6)
+        self.prev_x = x  # position before the last physics step, for interpolation
+        # x position and speed in 1/256 px so sub-pixel movement accumulates
+        self._x_q = x << FIXED_SHIFT
+        self.speed_q = int(speed * 256)
+
+    def update(self, mul_q):
+        # Move left by one fixed physics step; mul_q is the global speed multiplier in 1/256
+        self.prev_x = self.rect.x
+        self._x_q -= (self.speed_q * mul_q) >> FIXED_SHIFT
+        self.rect.x = self._x_q >> FIXED_SHIFT
+        self.hitbox.midbottom = self.rect.midbottom
+
+    def respawn(self, x, speed):
+        # Reuse a pooled stone at a new position instead of allocating one
+        self.rect.bottomleft = (x, GROUND_Y)
+        self.hitbox.midbottom = self.rect.midbottom
+        self.prev_x = x
+        self._x_q = x << FIXED_SHIFT
+        self.speed_q = int(speed * 256)
+
+# free stones, parked off screen until spawned
+STONE_POOL = [Stone(-1000, 0) for _ in range(16)]
 
 # Parallax background helper
 class Parallax:
@@ -184,73 +217,124 @@ class Parallax:
         self.speed_factor = speed_factor
         self.y_offset = y_offset
         self.x1 = 0
+        self.prev_x1 = 0
         # scale background to window width (preserve ratio)
         w = image.get_width()
         h = image.get_height()
         scale = HEIGHT / h
-        self.image = pygame.transform.smoothscale(image, (int(w * scale), HEIGHT))
+        self.image = pygame.transform.scale(image, (int(w * scale), HEIGHT)).convert_alpha()
         self.w = self.image.get_width()
+        # pre-compose two copies side by side so each frame is a single blit
+        self.strip = pygame.Surface((2 * self.w, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self.strip.blit(self.image, (0, 0))
+        self.strip.blit(self.image, (self.w, 0))
 
-    def update_and_draw(self, surf, global_speed):
+    def update(self, global_speed):
         shift = global_speed * self.speed_factor
+        self.prev_x1 = self.x1
         self.x1 -= shift
         if self.x1 <= -self.w:
             self.x1 += self.w
-        # draw two copies
-        surf.blit(self.image, (int(self.x1), self.y_offset))
-        surf.blit(self.image, (int(self.x1 + self.w), self.y_offset))
+            self.prev_x1 += self.w  # keep prev on the same side of the wrap
+
+    def draw(self, surf, alpha=1.0):
+        x = self.prev_x1 + (self.x1 - self.prev_x1) * alpha
+        # draw the visible window of the pre-composed strip
+        off = int(-x) % self.w
+        surf.blit(self.strip, (0, self.y_offset), area=pygame.Rect(off, 0, WIDTH, HEIGHT))
 
 # Road tiling
+SHADOW_SURF = pygame.Surface((WIDTH, 8), pygame.SRCALPHA)
+SHADOW_SURF.fill((0, 0, 0, 40))
+
 class Road:
     def __init__(self, image):
         h = image.get_height()
         scale = 120 / h
-        self.tile = pygame.transform.smoothscale(image, (int(image.get_width() * scale), 120))
+        self.tile = pygame.transform.scale(image, (int(image.get_width() * scale), 120)).convert_alpha()
         self.w = self.tile.get_width()
         self.x1 = 0
+        self.prev_x1 = 0
 
-    def update_and_draw(self, surf, speed):
+    def update(self, speed):
+        self.prev_x1 = self.x1
         self.x1 -= speed
         if self.x1 <= -self.w:
             self.x1 += self.w
+            self.prev_x1 += self.w  # keep prev on the same side of the wrap
+
+    def draw(self, surf, alpha=1.0):
         y = GROUND_Y
         # Draw enough tiles to fill the screen
-        x = int(self.x1)
-        while x < WIDTH:
-            surf.blit(self.tile, (x, y))
-            x += self.w
+        x = int(self.prev_x1 + (self.x1 - self.prev_x1) * alpha)
+        if x > 0:
+            x -= self.w
+        surf.blits([(self.tile, (tx, y)) for tx in range(x, WIDTH, self.w)], doreturn=False)
         # draw a darker overlay to simulate shadow
-        shadow = pygame.Surface((WIDTH, int(8)), pygame.SRCALPHA)
-        shadow.fill((0, 0, 0, 40))
-        surf.blit(shadow, (0, y - 8))
+        surf.blit(SHADOW_SURF, (0, y - 8))
+
+# Sky birds (lego pixel style), baked once per scale
+def make_bird_surf(scale):
+    # Simple lego-pixel bird: body, wing, beak; the wing rises above the body
+    lift = int(5*scale)
+    surf = pygame.Surface((int(24*scale), int(16*scale)), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(surf, (60,60,60), (0, lift, int(18*scale), int(8*scale)))
+    pygame.draw.rect(surf, (120,120,120), (int(7*scale), 0, int(10*scale), int(7*scale)))
+    pygame.draw.rect(surf, (255,200,60), (int(15*scale), lift + int(2*scale), int(4*scale), int(3*scale)))
+    return surf
+
+BIRD_SCALES = [1.2 - 0.2*i for i in range(3)]
+BIRD_SURFS = [make_bird_surf(scale) for scale in BIRD_SCALES]
+BIRD_LIFT = [int(5*scale) for scale in BIRD_SCALES]
+# birds drift on a 120-step cycle; precompute every position
+BIRD_X_TABLE = [[180 + i*180 + (t + i*60) % 120 for t in range(120)] for i in range(3)]
+BIRD_Y = [80 + (i%2)*22 - BIRD_LIFT[i] for i in range(3)]
 
 # --- Game state functions ---
-def spawn_stone_group(stone_group, current_speed):
+def spawn_stone_group(stones, current_speed):
     # Spawn stones at the right edge, moving left, with enough gap from last stone
     min_gap = 220  # minimum horizontal gap between stones (pixels)
     max_gap = 340  # maximum gap
     last_x = None
-    if len(stone_group) > 0:
+    if stones:
         # Find the rightmost stone
-        last_x = max(stone.rect.right for stone in stone_group)
+        last_x = max(stone.rect.right for stone in stones)
     else:
         last_x = WIDTH
     # Place new stone after last stone with a random gap
     gap = random.randint(min_gap, max_gap)
     x = max(WIDTH, last_x + gap)
-    stone = Stone(x, speed=current_speed * 0.85 + random.uniform(0.0, 1.0))
-    stone_group.add(stone)
+    speed = current_speed * 0.85 + random.uniform(0.0, 1.0)
+    if STONE_POOL:
+        stone = STONE_POOL.pop()
+        stone.respawn(x, speed)
+    else:
+        stone = Stone(x, speed=speed)
+    stones.append(stone)
+
+def cull_stones(stones):
+    # Return stones that went off screen to the pool
+    live = [s for s in stones if s.rect.right >= -50]
+    if len(live) != len(stones):
+        STONE_POOL.extend(s for s in stones if s.rect.right < -50)
+        stones[:] = live
 
 def draw_text_center(surf, text, fontobj, y, color=(255,255,255)):
     txt = fontobj.render(text, True, color)
     r = txt.get_rect(center=(WIDTH // 2, y))
     surf.blit(txt, r)
 
+# Sun and moon
+def draw_sun(surf):
+    pygame.draw.circle(surf, (255, 230, 80), (WIDTH-120, 90), 38)
+    pygame.draw.circle(surf, (255, 255, 180), (WIDTH-120, 90), 28)
+
+def draw_moon(surf):
+    pygame.draw.circle(surf, (220, 220, 255), (WIDTH-120, 90), 32)
+    pygame.draw.circle(surf, (40, 40, 80), (WIDTH-110, 90), 24)
+
 # --- Main loop / menu ---
-def main():
-    # --- Splash screen ---
-    splash_time = 0
-    splash_loader_angle = 0
+def run_splash():
     splash_duration = 1800  # ms
     splash_running = True
     splash_start = pygame.time.get_ticks()
@@ -260,7 +344,7 @@ def main():
                 pygame.quit()
                 sys.exit()
         # Draw splash image full screen
-        screen.blit(pygame.transform.smoothscale(splash_img, (WIDTH, HEIGHT)), (0, 0))
+        screen.blit(SPLASH_SCALED, (0, 0))
         # Draw loader (rotating arc) inside splash, right side, dark color
         loader_center = (WIDTH - 120, HEIGHT//2)
         loader_radius = 48
@@ -274,70 +358,14 @@ def main():
         pygame.display.flip()
         if pygame.time.get_ticks() - splash_start > splash_duration:
             splash_running = False
-    running = True
-    show_menu = True
-    # Persist night_mode across restarts
-    global _night_mode_state
-    try:
-        night_mode = _night_mode_state
-    except NameError:
-        night_mode = False
-    highscore = load_highscore()
-
-    # objects
-    player = Player()
-    stone_group = pygame.sprite.Group()
-
-    # parallax - two layers
-    day_bg = Parallax(bg_day_img, speed_factor=0.12)
-    night_bg = Parallax(bg_night_img, speed_factor=0.12)
-    road = Road(road_img)
-
-    # Sun, moon, and birds (lego pixel style)
-    def draw_sun(surf):
-        pygame.draw.circle(surf, (255, 230, 80), (WIDTH-120, 90), 38)
-        pygame.draw.circle(surf, (255, 255, 180), (WIDTH-120, 90), 28)
-
-    def draw_moon(surf):
-        pygame.draw.circle(surf, (220, 220, 255), (WIDTH-120, 90), 32)
-        pygame.draw.circle(surf, (40, 40, 80), (WIDTH-110, 90), 24)
-
-    def draw_bird(surf, x, y, scale=1.0):
-        # Simple lego-pixel bird: body, wing, beak
-        body = pygame.Rect(x, y, int(18*scale), int(8*scale))
-        wing = pygame.Rect(x+7*scale, y-5*scale, int(10*scale), int(7*scale))
-        pygame.draw.rect(surf, (60,60,60), body)
-        pygame.draw.rect(surf, (120,120,120), wing)
-        pygame.draw.rect(surf, (255,200,60), (x+15*scale, y+2*scale, int(4*scale), int(3*scale)))
-
-    # spawn timer
-    SPAWN_EVENT = pygame.USEREVENT + 1
-    spawn_interval = max(450, STONE_SPAWN_BASE - int(INITIAL_SPEED * 60))
-    pygame.time.set_timer(SPAWN_EVENT, spawn_interval)
-
-    speed = INITIAL_SPEED
-    distance = 0.0  # used for score
-    score = 0
-    run_time = 0
-    last_score_milestone = 0
-
-    # music
-    # Always play bgm.mp3 as background music if available
-    try:
-        pygame.mixer.music.set_volume(0.45)
-        if bgm_path.is_file():
-            if not pygame.mixer.music.get_busy():
-                pygame.mixer.music.play(-1)
-    except Exception:
-        pass
 
-    # Menu loop
+def run_menu(night_mode, highscore, day_preview, night_preview):
+    # returns (start_game, night_mode); start_game is False when the player quits
     menu_selection = 0  # 0: start, 1: toggle day/night, 2: quit
-    while show_menu and running:
+    while True:
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
-                running = False
-                show_menu = False
+                return False, night_mode
             elif ev.type == pygame.KEYDOWN:
                 if ev.key in (pygame.K_UP, pygame.K_w):
                     menu_selection = (menu_selection - 1) % 3
@@ -345,21 +373,17 @@ def main():
                     menu_selection = (menu_selection + 1) % 3
                 elif ev.key == pygame.K_RETURN:
                     if menu_selection == 0:
-                        show_menu = False
+                        return True, night_mode
                     elif menu_selection == 1:
                         night_mode = not night_mode
-                        _night_mode_state = night_mode  # persist across restarts
                     elif menu_selection == 2:
-                        running = False
-                        show_menu = False
+                        return False, night_mode
                 elif ev.key == pygame.K_ESCAPE:
-                    running = False
-                    show_menu = False
+                    return False, night_mode
 
         screen.fill((24, 24, 30))
         # draw a preview of day/night
-        bg_preview = night_bg.image if night_mode else day_bg.image
-        preview = pygame.transform.smoothscale(bg_preview, (int(WIDTH*0.9), int(HEIGHT*0.45)))
+        preview = night_preview if night_mode else day_preview
         screen.blit(preview, ((WIDTH - preview.get_width())//2, 40))
 
         draw_text_center(screen, "ONG JUMP", big_font, 48)
@@ -381,57 +405,87 @@ def main():
         pygame.display.flip()
         clock.tick(FPS)
 
-    # reset / start gameplay
-    stone_group.empty()
+def run_game(player, stones, day_bg, night_bg, road, night_mode, highscore):
+    # returns (keep_running, highscore); keep_running is False when the window is closed
+    # reset / start gameplay, reusing the existing objects
+    STONE_POOL.extend(stones)
+    stones.clear()
     player.rect.midbottom = (PLAYER_X, GROUND_Y)
-    player.vel_y = 0
+    player.hitbox.midbottom = player.rect.midbottom
+    player.prev_y = player.rect.y
+    player.vel_y_q = 0
+    player.jump_cooldown = 0
     speed = INITIAL_SPEED
-    distance = 0.0
+    distance = 0.0  # used for score
     score = 0
     run_time = 0
-    last_score_milestone = 0
-    # Make stones spawn further apart and a bit slower
-    pygame.time.set_timer(SPAWN_EVENT, random.randint(1400, 1800))
+    # Make stones spawn further apart and a bit slower; timed from the physics clock
+    spawn_accum = 0.0
+    next_spawn_ms = random.randint(1400, 1800)
+    # HUD text is re-rendered only when the shown value changes
+    last_score = None
+    last_speed = None
+    hs_surf = font.render(f"High: {highscore}", True, (255,200,120))
+    accum = 0.0
+    bg = night_bg if night_mode else day_bg
 
     # Main gameplay loop
-    while running:
+    handled_events = [pygame.QUIT, pygame.KEYDOWN]
+    while True:
         dt = clock.tick(FPS)  # milliseconds since last tick
         run_time += dt
-        for ev in pygame.event.get():
+        pygame.event.pump()
+        # only build event objects for what the loop handles; drop the rest in C
+        events = pygame.event.get(handled_events, pump=False)
+        pygame.event.clear(pump=False)
+        for ev in events:
             if ev.type == pygame.QUIT:
-                running = False
-            elif ev.type == SPAWN_EVENT:
-                spawn_stone_group(stone_group, current_speed=speed)
-                # At higher speeds, keep spawn interval high enough for fair gaps
-                min_spawn = max(700, int(1800 - speed * 80))
-                max_spawn = max(1100, int(2200 - speed * 100))
-                next_ms = random.randint(min_spawn, max_spawn)
-                pygame.time.set_timer(SPAWN_EVENT, next_ms)
+                return False, highscore
             elif ev.type == pygame.KEYDOWN:
                 if ev.key == pygame.K_SPACE:
                     player.jump()
                 elif ev.key == pygame.K_ESCAPE:
                     # Return to menu
-                    return
-
-        # gradually increase speed
-        speed += SPEED_INCREASE_RATE * dt
-        if speed > MAX_SPEED:
-            speed = MAX_SPEED
-        # update distance/score
-        distance += speed * (dt / 1000.0) * 100  # arbitrary distance units
-        new_score = int(distance // 10)
-        if new_score != score:
-            score = new_score
-            # milestone sound removed; now plays only on game over
-
-        # update sprites
-        player.update()
-        for stone in list(stone_group):
-            stone.update(speed_multiplier=speed/INITIAL_SPEED, dt=dt)
-
-        # collision detection (simple rect-based but can be improved)
-        collided = pygame.sprite.spritecollideany(player, stone_group, collided=pygame.sprite.collide_mask)
+                    return True, highscore
+
+        # advance physics in fixed steps so a long frame can't tunnel through stones
+        accum = min(accum + dt, PHYSICS_STEP * MAX_PHYSICS_STEPS)
+        collided = False
+        while accum >= PHYSICS_STEP and not collided:
+            accum -= PHYSICS_STEP
+            # gradually increase speed
+            speed += SPEED_INCREASE_RATE * PHYSICS_STEP
+            if speed > MAX_SPEED:
+                speed = MAX_SPEED
+            # update distance/score
+            distance += speed * (PHYSICS_STEP / 1000.0) * 100  # arbitrary distance units
+            new_score = int(distance // 10)
+            if new_score != score:
+                score = new_score
+                # milestone sound removed; now plays only on game over
+
+            # spawn stones
+            spawn_accum += PHYSICS_STEP
+            if spawn_accum >= next_spawn_ms:
+                spawn_stone_group(stones, current_speed=speed)
+                spawn_accum = 0.0
+                # At higher speeds, keep spawn interval high enough for fair gaps
+                min_spawn = max(700, int(1800 - speed * 80))
+                max_spawn = max(1100, int(2200 - speed * 100))
+                next_spawn_ms = random.randint(min_spawn, max_spawn)
+
+            # scroll scenery and update sprites
+            bg.update(global_speed=speed * 0.4)
+            road.update(speed)
+            player.update()
+            mul_q = int(speed * 256 / INITIAL_SPEED)
+            for stone in stones:
+                stone.update(mul_q)
+            # drop stones that went off screen
+            cull_stones(stones)
+
+            # collision detection: inset hitboxes, tested against all stones in one C call
+            collided = player.hitbox.collidelist([s.hitbox for s in stones]) != -1
         if collided:
             if hit_sfx:
                 hit_sfx.play()
@@ -439,49 +493,87 @@ def main():
             if score > highscore:
                 highscore = score
                 save_highscore(highscore)
-            # simple game over screen
+            # simple game over screen, then back to the menu
             game_over_screen(score, highscore)
-            # reset to menu
-            main()
-            return
+            return True, highscore
+
+        # draw between the last two physics states so uneven step counts don't stutter
+        alpha = accum / PHYSICS_STEP
 
         # draw background (parallax)
+        bg.draw(screen, alpha)
         if night_mode:
-            night_bg.update_and_draw(screen, global_speed=speed * 0.4)
             draw_moon(screen)
         else:
-            day_bg.update_and_draw(screen, global_speed=speed * 0.4)
             draw_sun(screen)
 
         # draw birds (lego pixel style, both modes)
+        tb = (run_time//7) % 120
         for i in range(3):
-            bx = 180 + i*180 + int((run_time//7 + i*60) % 120)
-            by = 80 + (i%2)*22
-            draw_bird(screen, bx, by, scale=1.2 - 0.2*i)
+            screen.blit(BIRD_SURFS[i], (BIRD_X_TABLE[i][tb], BIRD_Y[i]))
 
         # draw road
-        road.update_and_draw(screen, speed)
+        road.draw(screen, alpha)
 
-        # draw stones (obstacles)
-        for stone in stone_group:
-            stone.draw(screen)
+        # draw stones (obstacles) in one batched call
+        screen.blits([(s.image, (s.prev_x + (s.rect.x - s.prev_x) * alpha, s.rect.y)) for s in stones],
+                     doreturn=False)
 
         # draw player
-        player.draw(screen)
+        player.draw(screen, alpha)
 
         # UI: score & speed
-        score_surf = font.render(f"Score: {score}", True, (255,255,255))
-        speed_surf = font.render(f"Speed: {speed:.2f}", True, (255,255,255))
-        hs_surf = font.render(f"High: {highscore}", True, (255,200,120))
+        if score != last_score:
+            score_surf = font.render(f"Score: {score}", True, (255,255,255))
+            last_score = score
+        shown_speed = round(speed, 1)
+        if shown_speed != last_speed:
+            speed_surf = font.render(f"Speed: {shown_speed:.1f}", True, (255,255,255))
+            last_speed = shown_speed
         screen.blit(score_surf, (18, 18))
         screen.blit(speed_surf, (18, 50))
         screen.blit(hs_surf, (WIDTH - 140, 18))
 
         # small instruction
-        screen.blit(font.render("Press SPACE to jump", True, (200,200,200)), (18, HEIGHT-34))
+        screen.blit(INSTR_SURF, (18, HEIGHT-34))
 
         pygame.display.flip()
 
+def main():
+    run_splash()
+    night_mode = False
+    highscore = load_highscore()
+
+    # objects, created once and reset in place for every run
+    player = Player()
+    stones = []
+
+    # parallax - two layers
+    day_bg = Parallax(bg_day_img, speed_factor=0.12)
+    night_bg = Parallax(bg_night_img, speed_factor=0.12)
+    road = Road(road_img)
+    # menu previews of both modes, scaled once
+    preview_size = (int(WIDTH*0.9), int(HEIGHT*0.45))
+    day_preview = pygame.transform.smoothscale(day_bg.image, preview_size).convert_alpha()
+    night_preview = pygame.transform.smoothscale(night_bg.image, preview_size).convert_alpha()
+
+    # music
+    # Always play bgm.mp3 as background music if available
+    try:
+        pygame.mixer.music.set_volume(0.45)
+        if bgm_path.is_file():
+            if not pygame.mixer.music.get_busy():
+                pygame.mixer.music.play(-1)
+    except Exception:
+        pass
+
+    running = True
+    while running:
+        start_game, night_mode = run_menu(night_mode, highscore, day_preview, night_preview)
+        if not start_game:
+            break
+        running, highscore = run_game(player, stones, day_bg, night_bg, road, night_mode, highscore)
+
 def game_over_screen(score, highscore):
     # show result, allow restart or quit
     over = True
@@ -13,7 +13,55 @@ from kivy.clock import Clock
 from kivy.core.audio import SoundLoader
 from kivy.core.window import Window
 from kivy.graphics import Color, Rectangle, Ellipse
+from kivy.core.text import Label as CoreLabel
 import random
+import numpy as np
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # numba is not available on every target (e.g. Android); fall back to NumPy
+    HAVE_NUMBA = False
+
+MAX_STONES = 32
+
+def step_stones_np(sx, sy, sw, sh, n, dx, px, py, ps):
+    # Vectorized stone step: one pass to move, boolean-mask compaction of the
+    # stones still on screen, then a single AABB test against the player.
+    x = sx[:n]
+    np.subtract(x, dx, out=x)
+    keep = x + sw[:n] > 0
+    m = int(np.count_nonzero(keep))
+    if m != n:
+        sx[:m] = x[keep]
+        sy[:m] = sy[:n][keep]
+        sw[:m] = sw[:n][keep]
+        sh[:m] = sh[:n][keep]
+    x, y, w, h = sx[:m], sy[:m], sw[:m], sh[:m]
+    hit = bool(np.any((x < px + ps) & (x + w > px) & (y < py + ps) & (y + h > py)))
+    return m, hit
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def step_stones(sx, sy, sw, sh, n, dx, px, py, ps):
+        # Move stones left, compact off-screen ones away in place and test AABB
+        # collision against the player. Returns the new stone count and a hit flag.
+        m = 0
+        hit = False
+        for i in range(n):
+            x = sx[i] - dx
+            if x + sw[i] <= 0:
+                continue
+            sx[m] = x
+            sy[m] = sy[i]
+            sw[m] = sw[i]
+            sh[m] = sh[i]
+            if px < x + sw[i] and px + ps > x and py < sy[i] + sh[i] and py + ps > sy[i]:
+                hit = True
+            m += 1
+        return m, hit
+else:
+    step_stones = step_stones_np
 
 # Set window size for desktop testing
 Window.size = (1000, 560)
@@ -84,18 +132,24 @@ class OngJumpWidget(Widget):
         self.ROAD_TILE_W = 400
         self.ROAD_TILE_H = 120
         self.night_mode = False
+        self._label_cache = {}
         # Game state
         self.reset_game()
+        self.build_canvas()
         self._keyboard = Window.request_keyboard(self._on_keyboard_closed, self)
         if self._keyboard:
             self._keyboard.bind(on_key_down=self._on_key_down)
-        self.bind(size=self.update_canvas, pos=self.update_canvas)
+        self.bind(size=self.update_background, pos=self.update_background)
 
     def reset_game(self):
         self.player_y = self.GROUND_Y
         self.vel_y = 0
         self.on_ground = True
-        self.stones = []
+        self.stone_x = np.empty(MAX_STONES, np.float32)
+        self.stone_y = np.empty(MAX_STONES, np.float32)
+        self.stone_w = np.empty(MAX_STONES, np.float32)
+        self.stone_h = np.empty(MAX_STONES, np.float32)
+        self.n_stones = 0
         self.score = 0
         self.highscore = 0
         self.speed = self.INITIAL_SPEED
@@ -130,25 +184,25 @@ class OngJumpWidget(Widget):
         self.speed += self.SPEED_INCREASE_RATE * (dt * 1000)
         if self.speed > self.MAX_SPEED:
             self.speed = self.MAX_SPEED
-        for stone in self.stones:
-            stone['x'] -= self.speed * (dt * 60 / 1000)
-        self.stones = [s for s in self.stones if s['x'] + s['w'] > 0]
+        self.n_stones, hit = step_stones(
+            self.stone_x, self.stone_y, self.stone_w, self.stone_h, self.n_stones,
+            self.speed * (dt * 60 / 1000), self.PLAYER_X, self.player_y, self.PLAYER_SIZE)
+        # Collision detection
+        if hit:
+            self.game_running = False
+            self.game_over = True
+            if self.score > self.highscore:
+                self.highscore = self.score
         # Spawn new stone if needed
-        if len(self.stones) == 0 or (self.stones[-1]['x'] < self.WIDTH - self.stone_gap):
+        n = self.n_stones
+        if n < MAX_STONES and (n == 0 or self.stone_x[n - 1] < self.WIDTH - self.stone_gap):
             stone_w, stone_h = 60, 32
-            new_x = self.WIDTH + random.randint(20, 120)
-            self.stones.append({'x': new_x, 'y': self.GROUND_Y - stone_h, 'w': stone_w, 'h': stone_h})
+            self.stone_x[n] = self.WIDTH + random.randint(20, 120)
+            self.stone_y[n] = self.GROUND_Y - stone_h
+            self.stone_w[n] = stone_w
+            self.stone_h[n] = stone_h
+            self.n_stones = n + 1
             self.stone_gap = random.randint(self.MIN_STONE_GAP, self.MAX_STONE_GAP)
-        # Collision detection
-        player_rect = (self.PLAYER_X, self.player_y, self.PLAYER_SIZE, self.PLAYER_SIZE)
-        for stone in self.stones:
-            stone_rect = (stone['x'], stone['y'], stone['w'], stone['h'])
-            if self.rects_collide(player_rect, stone_rect):
-                self.game_running = False
-                self.game_over = True
-                if self.score > self.highscore:
-                    self.highscore = self.score
-                break
         # Scoring
         self.distance += self.speed * dt * 100
         new_score = int(self.distance // 10)
@@ -159,57 +213,94 @@ class OngJumpWidget(Widget):
         if self.road_offset <= -self.ROAD_TILE_W:
             self.road_offset += self.ROAD_TILE_W
         self.update_canvas()
-    def update_canvas(self, *args):
+    def build_canvas(self):
+        # Record every instruction once; update_canvas only mutates them
+        self.canvas.before.clear()
         self.canvas.clear()
+        with self.canvas.before:
+            # Background (day/night), only its texture changes on toggle
+            self.bg_color = Color(1, 1, 1, 1)
+            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+        self.update_background()
         with self.canvas:
-            # Background (day/night)
-            if self.night_mode and self.bg_night_img:
-                Rectangle(texture=self.bg_night_img, pos=self.pos, size=self.size)
-            elif not self.night_mode and self.bg_day_img:
-                Rectangle(texture=self.bg_day_img, pos=self.pos, size=self.size)
+            # Road tiling: enough tiles to cover the width at any scroll offset
+            if self.road_img:
+                Color(1, 1, 1, 1)
             else:
-                Color(0.8, 0.9, 1)
-                Rectangle(pos=self.pos, size=self.size)
-            # Road tiling
-            y = 0
-            x = self.road_offset
-            while x < self.WIDTH:
-                if self.road_img:
-                    Rectangle(texture=self.road_img, pos=(x, y), size=(self.ROAD_TILE_W, self.ROAD_TILE_H))
-                else:
-                    Color(0.3, 0.3, 0.3)
-                    Rectangle(pos=(x, y), size=(self.ROAD_TILE_W, self.ROAD_TILE_H))
-                x += self.ROAD_TILE_W
-            # Stones
-            for stone in self.stones:
-                if self.stone_img:
-                    Rectangle(texture=self.stone_img, pos=(stone['x'], stone['y']), size=(stone['w'], stone['h']))
-                else:
-                    Color(0.5, 0.5, 0.5)
-                    Rectangle(pos=(stone['x'], stone['y']), size=(stone['w'], stone['h']))
+                Color(0.3, 0.3, 0.3)
+            n_tiles = self.WIDTH // self.ROAD_TILE_W + 2
+            self.road_instrs = [Rectangle(texture=self.road_img, size=(self.ROAD_TILE_W, self.ROAD_TILE_H))
+                                for _ in range(n_tiles)]
+            # Stones, hidden (zero size) until in use
+            if self.stone_img:
+                Color(1, 1, 1, 1)
+            else:
+                Color(0.5, 0.5, 0.5)
+            self.stone_instrs = [Rectangle(texture=self.stone_img, size=(0, 0)) for _ in range(MAX_STONES)]
             # Player
             if self.player_img:
-                Rectangle(texture=self.player_img, pos=(self.PLAYER_X, self.player_y), size=(self.PLAYER_SIZE, self.PLAYER_SIZE))
+                Color(1, 1, 1, 1)
+                self.player_instr = Rectangle(texture=self.player_img, size=(self.PLAYER_SIZE, self.PLAYER_SIZE))
             else:
                 Color(1, 0.8, 0.2)
-                Ellipse(pos=(self.PLAYER_X, self.player_y), size=(self.PLAYER_SIZE, self.PLAYER_SIZE))
-            # Score
+                self.player_instr = Ellipse(size=(self.PLAYER_SIZE, self.PLAYER_SIZE))
+            # Score and game over text
             Color(1,1,1,1)
-            from kivy.core.text import Label as CoreLabel
-            label = CoreLabel(text=f"Score: {self.score}", font_size=32)
+            self.score_instr = Rectangle(pos=(18, self.HEIGHT-50), size=(0, 0))
+            self.high_instr = Rectangle(pos=(self.WIDTH-180, self.HEIGHT-50), size=(0, 0))
+            self.game_over_instr = Rectangle(pos=(self.WIDTH//2-180, self.HEIGHT//2), size=(0, 0))
+            self.restart_instr = Rectangle(pos=(self.WIDTH//2-180, self.HEIGHT//2-60), size=(0, 0))
+        self.update_canvas()
+    def update_background(self, *args):
+        bg = self.bg_night_img if self.night_mode else self.bg_day_img
+        self.bg_rect.texture = bg
+        self.bg_color.rgba = (1, 1, 1, 1) if bg else (0.8, 0.9, 1, 1)
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+    def update_canvas(self, *args):
+        # Road tiling
+        x = self.road_offset
+        for tile in self.road_instrs:
+            tile.pos = (x, 0)
+            x += self.ROAD_TILE_W
+        # Stones
+        n = self.n_stones
+        for i, instr in enumerate(self.stone_instrs):
+            if i < n:
+                instr.pos = (float(self.stone_x[i]), float(self.stone_y[i]))
+                instr.size = (float(self.stone_w[i]), float(self.stone_h[i]))
+            elif instr.size[0]:
+                instr.size = (0, 0)
+        # Player
+        self.player_instr.pos = (self.PLAYER_X, self.player_y)
+        # Score
+        self._set_text(self.score_instr, f"Score: {self.score}", 32)
+        self._set_text(self.high_instr, f"High: {self.highscore}", 28)
+        # Game over
+        if self.game_over:
+            self._set_text(self.game_over_instr, "GAME OVER", 64)
+            self._set_text(self.restart_instr, "Press SPACE to restart", 32)
+        else:
+            self.game_over_instr.size = (0, 0)
+            self.restart_instr.size = (0, 0)
+    def _set_text(self, instr, s, size):
+        tex = self._text_tex(s, size)
+        # hidden instructions keep their texture but have zero size
+        if instr.texture is not tex or not instr.size[0]:
+            instr.texture = tex
+            instr.size = tex.size
+    def _text_tex(self, s, size):
+        # Rasterize each (text, size) pair once and reuse the texture
+        key = (s, size)
+        tex = self._label_cache.get(key)
+        if tex is None:
+            # score text keeps changing, so keep the cache from growing without bound
+            if len(self._label_cache) >= 64:
+                self._label_cache.clear()
+            label = CoreLabel(text=s, font_size=size)
             label.refresh()
-            Rectangle(texture=label.texture, pos=(18, self.HEIGHT-50), size=label.texture.size)
-            label2 = CoreLabel(text=f"High: {self.highscore}", font_size=28)
-            label2.refresh()
-            Rectangle(texture=label2.texture, pos=(self.WIDTH-180, self.HEIGHT-50), size=label2.texture.size)
-            # Game over
-            if self.game_over:
-                label3 = CoreLabel(text="GAME OVER", font_size=64)
-                label3.refresh()
-                Rectangle(texture=label3.texture, pos=(self.WIDTH//2-180, self.HEIGHT//2), size=label3.texture.size)
-                label4 = CoreLabel(text="Press SPACE to restart", font_size=32)
-                label4.refresh()
-                Rectangle(texture=label4.texture, pos=(self.WIDTH//2-180, self.HEIGHT//2-60), size=label4.texture.size)
+            tex = self._label_cache[key] = label.texture
+        return tex
     def _on_keyboard_closed(self):
         self._keyboard = None
     def _on_key_down(self, keyboard, keycode, text, modifiers):
@@ -220,15 +311,9 @@ class OngJumpWidget(Widget):
                 self.vel_y = self.JUMP_VELOCITY
         elif keycode[1] == 'n':
             self.night_mode = not self.night_mode
-            self.update_canvas()
+            self.update_background()
         return True
 
-    @staticmethod
-    def rects_collide(r1, r2):
-        x1, y1, w1, h1 = r1
-        x2, y2, w2, h2 = r2
-        return (x1 < x2 + w2 and x1 + w1 > x2 and y1 < y2 + h2 and y1 + h1 > y2)
-
 class OngJumpApp(App):
     def build(self):
         sm = ScreenManager()